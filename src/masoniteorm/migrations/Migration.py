@@ -1,9 +1,5 @@
 import os
-from os import listdir
-from os.path import isfile, join
-from pydoc import locate
-
-from inflection import camelize
+from functools import lru_cache
 
 from ..models.MigrationModel import MigrationModel
 from ..schema import Schema
@@ -11,6 +7,33 @@ from ..config import load_config
 
 from timeit import default_timer as timer
 
+_IGNORED_FILES = frozenset({"__init__.py", "__pycache__"})
+
+
+@lru_cache(maxsize=None)
+def _classname_for(file_name):
+    from inflection import camelize
+
+    stem = file_name[:-3] if file_name.endswith(".py") else file_name
+    return stem, camelize("_".join(stem.split("_")[4:]))
+
+
+_located = {}
+
+
+def _locate(migration_directory, file_name, class_name):
+    path = f"{migration_directory}.{file_name}.{class_name}"
+    if path not in _located:
+        from pydoc import locate
+
+        migration_class = locate(path)
+        if migration_class is None:
+            return None
+
+        _located[path] = migration_class
+
+    return _located[path]
+
 
 class Migration:
     def __init__(
@@ -24,6 +47,10 @@ class Migration:
     ):
         self.connection = connection
         self.migration_directory = migration_directory
+        self._migration_fs_path = os.path.join(os.getcwd(), migration_directory)
+        self._migration_module_path = migration_directory.replace("/", ".").replace(
+            "\\", "."
+        )
         self.last_migrations_ran = []
         self.command_class = command_class
 
@@ -55,40 +82,48 @@ class Migration:
 
         return False
 
-    def get_unran_migrations(self):
-        directory_path = os.path.join(os.getcwd(), self.migration_directory)
-        all_migrations = [
-            f.replace(".py", "")
-            for f in listdir(directory_path)
-            if isfile(join(directory_path, f))
-            and f != "__init__.py"
-            and not f.startswith(".")
+    def _list_migration_files(self):
+        with os.scandir(self._migration_fs_path) as entries:
+            return sorted(
+                _classname_for(entry.name)[0]
+                for entry in entries
+                if entry.name not in _IGNORED_FILES
+                and not entry.name.startswith(".")
+                and not entry.name.endswith(".pyc")
+                and entry.is_file()
+            )
+
+    def _filter_unran(self, applied):
+        return [
+            migration
+            for migration in self._list_migration_files()
+            if migration not in applied
         ]
-        all_migrations.sort()
-        unran_migrations = []
-        database_migrations = self.migration_model.all()
-        for migration in all_migrations:
-            if migration not in database_migrations.pluck("migration"):
-                unran_migrations.append(migration)
-        return unran_migrations
+
+    def get_unran_migrations(self):
+        return self._filter_unran(
+            frozenset(self.migration_model.all().pluck("migration"))
+        )
+
+    def _load_migration_state(self):
+        rows = list(self.migration_model.all())
+        applied = frozenset(row.migration for row in rows)
+        last_batch = max((row.batch for row in rows), default=0)
+        return applied, last_batch
 
     def get_rollback_migrations(self):
-        return (
-            self.migration_model.where("batch", self.migration_model.all().max("batch"))
+        rows = (
+            self.migration_model.where("batch", self.migration_model.new().max("batch"))
             .order_by("migration_id", "desc")
             .get()
-            .pluck("migration")
         )
+        return [row.migration for row in rows]
 
     def get_all_migrations(self, reverse=False):
-        if reverse:
-            return (
-                self.migration_model.order_by("migration_id", "desc")
-                .get()
-                .pluck("migration")
-            )
-
-        return self.migration_model.all().pluck("migration")
+        rows = self.migration_model.order_by(
+            "migration_id", "desc" if reverse else "asc"
+        ).get()
+        return [row.migration for row in rows]
 
     def get_last_batch_number(self):
         return self.migration_model.select("batch").get().max("batch")
@@ -97,44 +132,22 @@ class Migration:
         return self.migration_model.where("migration", file_path).delete()
 
     def locate(self, file_name):
-        migration_name = camelize("_".join(file_name.split("_")[4:]).replace(".py", ""))
-        file_name = file_name.replace(".py", "")
-        migration_directory = self.migration_directory.replace("/", ".").replace(
-            "\\", "."
-        )
-        return locate(f"{migration_directory}.{file_name}.{migration_name}")
+        file_name, migration_name = _classname_for(file_name)
+        return _locate(self._migration_module_path, file_name, migration_name)
 
     def get_ran_migrations(self):
-        directory_path = os.path.join(os.getcwd(), self.migration_directory)
-        all_migrations = [
-            f.replace(".py", "")
-            for f in listdir(directory_path)
-            if isfile(join(directory_path, f))
-            and f != "__init__.py"
-            and not f.startswith(".")
+        applied = {row.migration: row.batch for row in self.migration_model.all()}
+        return [
+            {"migration_file": migration, "batch": applied[migration]}
+            for migration in self._list_migration_files()
+            if migration in applied
         ]
-        all_migrations.sort()
-        ran = []
-
-        database_migrations = self.migration_model.all()
-        for migration in all_migrations:
-            matched_migration = database_migrations.where(
-                "migration", migration
-            ).first()
-            if matched_migration:
-                ran.append(
-                    {
-                        "migration_file": matched_migration.migration,
-                        "batch": matched_migration.batch,
-                    }
-                )
-        return ran
 
     def migrate(self, migration="all", output=False):
-        default_migrations = self.get_unran_migrations()
-        migrations = default_migrations if migration == "all" else [migration]
+        applied, last_batch = self._load_migration_state()
+        migrations = self._filter_unran(applied) if migration == "all" else [migration]
 
-        batch = self.get_last_batch_number() + 1
+        batch = last_batch + 1
 
         for migration in migrations:
             try:
@@ -156,9 +169,11 @@ class Migration:
 
             if output:
                 migration_class.schema.dry()
-            start = timer()
+            if self.command_class:
+                start = timer()
             migration_class.up()
-            duration = "{:.2f}".format(timer() - start)
+            if self.command_class:
+                duration = "{:.2f}".format(timer() - start)
 
             if output:
                 if self.command_class:
@@ -179,7 +194,7 @@ class Migration:
                 )
 
             self.migration_model.create(
-                {"batch": batch, "migration": migration.replace(".py", "")}
+                {"batch": batch, "migration": _classname_for(migration)[0]}
             )
 
     def rollback(self, migration="all", output=False):
@@ -208,9 +223,11 @@ class Migration:
             if output:
                 migration_class.schema.dry()
 
-            start = timer()
+            if self.command_class:
+                start = timer()
             migration_class.down()
-            duration = "{:.2f}".format(timer() - start)
+            if self.command_class:
+                duration = "{:.2f}".format(timer() - start)
 
             if output:
                 if self.command_class:
@@ -240,7 +257,10 @@ class Migration:
                 )
 
     def delete_migrations(self, migrations=None):
-        return self.migration_model.where_in("migration", migrations or []).delete()
+        if not migrations:
+            return 0
+
+        return self.migration_model.where_in("migration", migrations).delete()
 
     def delete_last_batch(self):
         return self.migration_model.where(
@@ -257,30 +277,32 @@ class Migration:
             else:
                 print("Nothing to reset")
 
-        for migration in migrations:
-            if self.command_class:
-                self.command_class.line(
-                    f"<comment>Rolling back:</comment> <question>{migration}</question>"
-                )
-
-            try:
-                self.locate(migration)(
-                    connection=self.connection, schema=self.schema_name
-                ).down()
-            except TypeError:
-                self.command_class.line(f"<error>Not Found: {migration}</error>")
-                continue
-
-                # raise MigrationNotFound(f"Could not find {migration}")
+        deleted = []
+        try:
+            for migration in migrations:
+                if self.command_class:
+                    self.command_class.line(
+                        f"<comment>Rolling back:</comment> <question>{migration}</question>"
+                    )
+
+                try:
+                    self.locate(migration)(
+                        connection=self.connection, schema=self.schema_name
+                    ).down()
+                except TypeError:
+                    self.command_class.line(f"<error>Not Found: {migration}</error>")
+                    continue
 
-            self.delete_migration(migration)
+                    # raise MigrationNotFound(f"Could not find {migration}")
 
-            if self.command_class:
-                self.command_class.line(
-                    f"<info>Rolled back:</info> <question>{migration}</question>"
-                )
+                deleted.append(migration)
 
-            self.delete_migrations([migration])
+                if self.command_class:
+                    self.command_class.line(
+                        f"<info>Rolled back:</info> <question>{migration}</question>"
+                    )
+        finally:
+            self.delete_migrations(deleted)
 
         if self.command_class:
             self.command_class.line("")
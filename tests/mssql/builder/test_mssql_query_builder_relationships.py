@@ -44,11 +44,15 @@ class User(Model):
 class BaseTestQueryRelationships(unittest.TestCase):
     maxDiff = None
 
+    @classmethod
+    def setUpClass(cls):
+        cls._factory = MockConnectionFactory()
+        cls._connection = cls._factory.make("mssql")
+
     def get_builder(self, table="users"):
-        connection = MockConnectionFactory().make("mssql")
         return QueryBuilder(
             grammar=MSSQLGrammar,
-            connection_class=connection,
+            connection_class=self._connection,
             connection="mssql",
             table=table,
             model=User,
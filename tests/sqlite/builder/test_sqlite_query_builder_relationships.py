@@ -44,10 +44,17 @@ class User(Model):
 class BaseTestQueryRelationships(unittest.TestCase):
     maxDiff = None
 
+    @classmethod
+    def setUpClass(cls):
+        cls._factory = MockConnectionFactory()
+        cls._connection = cls._factory.make("sqlite")
+
     def get_builder(self, table="users"):
-        connection = MockConnectionFactory().make("sqlite")
         return QueryBuilder(
-            grammar=SQLiteGrammar, connection_class=connection, table=table, model=User
+            grammar=SQLiteGrammar,
+            connection_class=self._connection,
+            table=table,
+            model=User,
         )
 
     def test_has(self):
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.masoniteorm.migrations import Migration
+from src.masoniteorm.migrations.Migration import _located
+
+
+class TestSQLiteMigrations(unittest.TestCase):
+    def setUp(self):
+        self.migration = Migration(connection="dev")
+        self.migration.create_table_if_not_exists()
+        self.migration.migration_model.delete()
+        for batch, name in (
+            (1, "2020_01_01_000000_first_batch"),
+            (2, "2020_01_02_000000_second_batch"),
+            (2, "2020_01_03_000000_second_batch_again"),
+        ):
+            self.migration.migration_model.create({"batch": batch, "migration": name})
+
+    def tearDown(self):
+        self.migration.migration_model.delete()
+
+    def make_migration_directory(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for file_name in (
+            "2020_01_01_000000_first_batch.py",
+            "2020_01_02_000000_second_batch.py",
+            "2020_01_04_000000_not_ran_yet.py",
+            "2020_01_05_000000_add.pyc_files.py",
+            "2020_01_04_000000_not_ran_yet.cpython-38.pyc",
+            "__init__.py",
+            ".DS_Store",
+        ):
+            open(os.path.join(directory.name, file_name), "w").close()
+        os.mkdir(os.path.join(directory.name, "__pycache__"))
+
+        return Migration(connection="dev", migration_directory=directory.name)
+
+    def test_get_unran_migrations(self):
+        migration = self.make_migration_directory()
+        self.assertEqual(
+            migration.get_unran_migrations(),
+            ["2020_01_04_000000_not_ran_yet", "2020_01_05_000000_add.pyc_files"],
+        )
+
+    def test_get_ran_migrations(self):
+        migration = self.make_migration_directory()
+        self.assertEqual(
+            migration.get_ran_migrations(),
+            [
+                {"migration_file": "2020_01_01_000000_first_batch", "batch": 1},
+                {"migration_file": "2020_01_02_000000_second_batch", "batch": 2},
+            ],
+        )
+
+    def test_get_rollback_migrations_returns_last_batch(self):
+        self.assertEqual(
+            self.migration.get_rollback_migrations(),
+            ["2020_01_03_000000_second_batch_again", "2020_01_02_000000_second_batch"],
+        )
+
+    def test_get_rollback_migrations_with_no_migrations(self):
+        self.migration.migration_model.delete()
+        self.assertEqual(self.migration.get_rollback_migrations(), [])
+
+    def test_reset_deletes_completed_migrations_when_a_later_one_fails(self):
+        class Completed:
+            def __init__(self, **kwargs):
+                pass
+
+            def down(self):
+                pass
+
+        class Failing(Completed):
+            def down(self):
+                raise RuntimeError("down failed")
+
+        def locate(migration):
+            return Failing if migration.endswith("second_batch") else Completed
+
+        with mock.patch.object(self.migration, "locate", side_effect=locate):
+            with self.assertRaises(RuntimeError):
+                self.migration.reset()
+
+        self.assertEqual(
+            self.migration.get_all_migrations(),
+            ["2020_01_01_000000_first_batch", "2020_01_02_000000_second_batch"],
+        )
+
+    def test_locate_does_not_cache_missing_migrations(self):
+        name = "2020_01_04_000000_create_missing_table"
+        with mock.patch.dict(_located), mock.patch(
+            "pydoc.locate", side_effect=[None, Migration]
+        ):
+            self.assertIsNone(self.migration.locate(name))
+            self.assertIs(self.migration.locate(name), Migration)
+
+    def test_delete_migrations_without_migrations_deletes_nothing(self):
+        self.assertEqual(self.migration.delete_migrations([]), 0)
+        self.assertEqual(self.migration.delete_migrations(), 0)
+        self.assertEqual(len(self.migration.get_all_migrations()), 3)